@@ -7,6 +7,9 @@ Run with:
 from __future__ import annotations
 
 import sys
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # Ensure the src/ package is importable when running via `streamlit run app.py`
@@ -15,95 +18,171 @@ sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
 import streamlit as st
 
 from tts_tester.cache import get_cached_voices, save_voices
-from tts_tester.config import ENCODING_MAP, load_config
+from tts_tester.config import ENCODING_INDEX, ENCODING_MIME_TYPES, ENCODING_NAMES, load_config
 from tts_tester.tts import list_voices, synthesize
+from tts_tester.voices import Voice
 
 st.set_page_config(page_title="TTS Tester", page_icon="🔊", layout="centered")
 st.title("🔊 Google Cloud TTS Tester")
 
 cfg = load_config()
 
+# Stop polling a voice fetch that hasn't finished after this many seconds
+_VOICE_FETCH_TIMEOUT = 30.0
+
+
+@st.cache_resource(ttl=cfg.cache_ttl_seconds, show_spinner=False)
+def _voice_future() -> Future[list[Voice]]:
+    """Fetch the voice list on a background thread, once per process."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voices")
+    future = executor.submit(_fetch_voices)
+    executor.shutdown(wait=False)
+    return future
+
+
+def _fetch_voices() -> list[Voice]:
+    voices = list_voices()
+    save_voices(voices)
+    return voices
+
+
 # ── Sidebar: voice browser ──────────────────────────────────────────────────
 
 with st.sidebar:
     st.header("Voice browser")
     refresh = st.button("🔄 Refresh voice list")
 
-    voices = None
-    if not refresh:
-        voices = get_cached_voices(ttl_seconds=cfg.cache_ttl_seconds)
-
-    if voices is None:
-        with st.spinner("Fetching voices …"):
-            try:
-                voices = list_voices()
-                save_voices(voices)
-            except Exception as exc:
-                st.error(f"Failed to fetch voices: {exc}")
+    if refresh:
+        _voice_future.clear()
+        # Drop the derived index with the list so they never go out of sync
+        for key in ("voices", "by_lang", "all_langs"):
+            st.session_state.pop(key, None)
+        st.session_state["fetching_voices"] = True
+        st.session_state.pop("voices_fetch_started", None)
+
+    if "voices" not in st.session_state:
+        voices = None
+        if not st.session_state.get("fetching_voices"):
+            voices = get_cached_voices(ttl_seconds=cfg.cache_ttl_seconds)
+
+        if voices is None:
+            # Don't block the first render on the API; poll until it's done
+            st.session_state["fetching_voices"] = True
+            started = st.session_state.setdefault("voices_fetch_started", time.monotonic())
+            future = _voice_future()
+            if future.done():
+                st.session_state["fetching_voices"] = False
+                st.session_state.pop("voices_fetch_started", None)
+                try:
+                    voices = future.result()
+                except Exception as exc:
+                    st.error(f"Failed to fetch voices: {exc}")
+                    voices = []
+                    # Don't pin the failure for the whole TTL; retry next time
+                    _voice_future.clear()
+            elif time.monotonic() - started > _VOICE_FETCH_TIMEOUT:
+                st.session_state["fetching_voices"] = False
+                st.session_state.pop("voices_fetch_started", None)
+                st.error(
+                    f"Fetching voices took longer than {_VOICE_FETCH_TIMEOUT:.0f} s. "
+                    "Click 🔄 Refresh voice list to try again."
+                )
                 voices = []
 
+        if voices is not None:
+            # Keep the parsed list and a language -> voice-index map for the session
+            by_lang: defaultdict[str, list[int]] = defaultdict(list)
+            for i, v in enumerate(voices):
+                for lc in v.language_codes:
+                    by_lang[lc].append(i)
+            st.session_state["voices"] = voices
+            st.session_state["by_lang"] = by_lang
+            st.session_state["all_langs"] = sorted(by_lang)
+
+    voices_loading = "voices" not in st.session_state
+    if voices_loading:
+        st.caption("Loading voices …")
+
+    voices = st.session_state.get("voices", [])
+    all_langs = st.session_state.get("all_langs", [])
+
     # Language filter
-    all_langs = sorted({lc for v in voices for lc in v["language_codes"]})
     lang_filter = st.selectbox("Language", ["(all)"] + all_langs, index=0)
 
     filtered = voices
-    if lang_filter != "(all)":
-        filtered = [v for v in filtered if lang_filter in v["language_codes"]]
+    if lang_filter != "(all)" and not voices_loading:
+        filtered = [voices[i] for i in st.session_state["by_lang"].get(lang_filter, [])]
 
-    voice_names = [v["name"] for v in filtered]
+    voice_names = [v.name for v in filtered]
     st.caption(f"{len(voice_names)} voice(s)")
 
 # ── Main area ────────────────────────────────────────────────────────────────
 
-text = st.text_area("Text or SSML to synthesize", height=150, placeholder="Hello, world!")
-
-col1, col2 = st.columns(2)
-with col1:
-    language_code = st.text_input("Language code", value=cfg.language_code)
-    encoding = st.selectbox("Encoding", list(ENCODING_MAP.keys()), index=list(ENCODING_MAP.keys()).index(cfg.encoding))
-with col2:
-    voice_name = st.selectbox("Voice", ["(default)"] + voice_names)
-    if voice_name == "(default)":
-        voice_name = ""
-
-col3, col4, col5 = st.columns(3)
-with col3:
-    speaking_rate = st.slider("Speed", 0.25, 4.0, cfg.speaking_rate, step=0.05)
-with col4:
-    pitch = st.slider("Pitch", -20.0, 20.0, cfg.pitch, step=0.5)
-with col5:
-    volume_gain_db = st.slider("Volume dB", -10.0, 10.0, cfg.volume_gain_db, step=0.5)
-
-if st.button("🎧 Generate", type="primary"):
-    if not text.strip():
-        st.warning("Please enter some text.")
-    else:
-        scfg = load_config(
-            overrides={
-                "language_code": language_code,
-                "voice_name": voice_name,
-                "encoding": encoding,
-                "speaking_rate": speaking_rate,
-                "pitch": pitch,
-                "volume_gain_db": volume_gain_db,
+
+@st.fragment
+def _synth_controls(voice_names: list[str]) -> None:
+    """Text, voice and audio controls.
+
+    Runs as a fragment so slider and text tweaks rerun only this block,
+    not the sidebar's voice browser.
+    """
+    text = st.text_area("Text or SSML to synthesize", height=150, placeholder="Hello, world!")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        language_code = st.text_input("Language code", value=cfg.language_code)
+        encoding = st.selectbox("Encoding", ENCODING_NAMES, index=ENCODING_INDEX.get(cfg.encoding.upper(), 0))
+    with col2:
+        voice_name = st.selectbox("Voice", ["(default)"] + voice_names)
+        if voice_name == "(default)":
+            voice_name = ""
+
+    col3, col4, col5 = st.columns(3)
+    with col3:
+        speaking_rate = st.slider("Speed", 0.25, 4.0, cfg.speaking_rate, step=0.05)
+    with col4:
+        pitch = st.slider("Pitch", -20.0, 20.0, cfg.pitch, step=0.5)
+    with col5:
+        volume_gain_db = st.slider("Volume dB", -10.0, 10.0, cfg.volume_gain_db, step=0.5)
+
+    if st.button("🎧 Generate", type="primary"):
+        if not text.strip():
+            st.warning("Please enter some text.")
+        else:
+            scfg = load_config(
+                overrides={
+                    "language_code": language_code,
+                    "voice_name": voice_name,
+                    "encoding": encoding,
+                    "speaking_rate": speaking_rate,
+                    "pitch": pitch,
+                    "volume_gain_db": volume_gain_db,
+                }
+            )
+            with st.spinner("Synthesizing …"):
+                try:
+                    result = synthesize(text, scfg)
+                except Exception as exc:
+                    st.error(f"Synthesis failed: {exc}")
+                    return
+
+            # Keep the audio so later reruns don't touch the disk at all
+            st.session_state["last_audio"] = {
+                "name": result.path.name,
+                "data": result.audio_content,
+                "mime": ENCODING_MIME_TYPES.get(encoding, "audio/mpeg"),
             }
-        )
-        with st.spinner("Synthesizing …"):
-            try:
-                out = synthesize(text, scfg)
-            except Exception as exc:
-                st.error(f"Synthesis failed: {exc}")
-                st.stop()
-
-        st.success(f"Saved to `{out.name}` ({out.stat().st_size / 1024:.1f} KB)")
-
-        mime = {
-            "MP3": "audio/mpeg",
-            "OGG_OPUS": "audio/ogg",
-            "LINEAR16": "audio/wav",
-            "MULAW": "audio/wav",
-            "ALAW": "audio/wav",
-        }.get(encoding, "audio/mpeg")
-
-        st.audio(out.read_bytes(), format=mime)
-        st.download_button("⬇ Download", data=out.read_bytes(), file_name=out.name, mime=mime)
+
+    if "last_audio" in st.session_state:
+        last = st.session_state["last_audio"]
+        st.success(f"Saved to `{last['name']}` ({len(last['data']) / 1024:.1f} KB)")
+        st.audio(last["data"], format=last["mime"])
+        st.download_button("⬇ Download", data=last["data"], file_name=last["name"], mime=last["mime"])
+
+
+_synth_controls(voice_names)
+
+if voices_loading:
+    # Re-run shortly so the sidebar picks up the voice list once it arrives
+    time.sleep(0.25)
+    st.rerun()
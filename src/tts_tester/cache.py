@@ -2,43 +2,57 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import time
 from pathlib import Path
-from typing import Any
+
+import msgspec
+
+from tts_tester.voices import Voice
 
 _CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".cache"
 _CACHE_FILE = _CACHE_DIR / "voices.json"
 
 
-def _read_cache() -> dict[str, Any] | None:
+class _CachePayload(msgspec.Struct):
+    cached_at: float = 0.0
+    voices: list[Voice] = []
+
+
+_DECODER = msgspec.json.Decoder(_CachePayload)
+_ENCODER = msgspec.json.Encoder()
+
+
+def _read_cache() -> _CachePayload | None:
     if not _CACHE_FILE.exists():
         return None
     try:
-        with open(_CACHE_FILE, encoding="utf-8") as fh:
-            return json.load(fh)
-    except (json.JSONDecodeError, OSError):
+        # Keyed on mtime so a rewrite by save_voices() invalidates the memo
+        return _read_cache_memo(str(_CACHE_FILE), _CACHE_FILE.stat().st_mtime_ns)
+    except (msgspec.DecodeError, OSError):
         return None
 
 
-def get_cached_voices(ttl_seconds: int = 86_400) -> list[dict[str, Any]] | None:
+@functools.lru_cache(maxsize=4)
+def _read_cache_memo(path: str, mtime_ns: int) -> _CachePayload:
+    return _DECODER.decode(Path(path).read_bytes())
+
+
+def get_cached_voices(ttl_seconds: int = 86_400) -> list[Voice] | None:
     """Return the cached voice list if it exists and is fresh, else ``None``."""
     data = _read_cache()
     if data is None:
         return None
-    cached_at: float = data.get("cached_at", 0)
-    if (time.time() - cached_at) > ttl_seconds:
+    if (time.time() - data.cached_at) > ttl_seconds:
         return None
-    voices: list[dict[str, Any]] = data.get("voices", [])
-    return voices
+    return data.voices
 
 
-def save_voices(voices: list[dict[str, Any]]) -> None:
+def save_voices(voices: list[Voice]) -> None:
     """Persist *voices* to the local cache file."""
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    payload = {"cached_at": time.time(), "voices": voices}
-    with open(_CACHE_FILE, "w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2)
+    payload = _CachePayload(cached_at=time.time(), voices=voices)
+    _CACHE_FILE.write_bytes(msgspec.json.format(_ENCODER.encode(payload), indent=2))
 
 
 def clear_cache() -> None:
@@ -10,8 +10,10 @@ from typing import Sequence
 from tts_tester import __version__
 from tts_tester.cache import clear_cache, get_cached_voices, save_voices
 from tts_tester.config import TTSConfig, load_config
+from tts_tester.daemon import request_synthesis, serve
 from tts_tester.player import play
-from tts_tester.tts import list_voices, synthesize
+from tts_tester.tts import list_voices, stream_synthesize, synthesize
+from tts_tester.voices import Voice
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -55,10 +57,19 @@ def _build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--volume", type=float, default=None, dest="volume_gain_db", help="Volume gain dB (-96 to 16).")
     sp.add_argument("-o", "--output", type=Path, default=None, help="Output file path.")
     sp.add_argument("--no-play", action="store_true", help="Skip automatic playback.")
+    sp.add_argument("--blocking", action="store_true", help="Wait for playback to finish before exiting.")
+    sp.add_argument(
+        "--stream",
+        action="store_true",
+        help="Use the streaming API (Chirp 3 HD voices, LINEAR16/OGG_OPUS only).",
+    )
 
     # ── interactive ──────────────────────────────────────────────────
     sub.add_parser("interactive", help="Launch interactive prompt mode.")
 
+    # ── daemon ───────────────────────────────────────────────────────
+    sub.add_parser("daemon", help="Keep one authenticated API client for later synth calls.")
+
     return parser
 
 
@@ -69,49 +80,53 @@ def _build_parser() -> argparse.ArgumentParser:
 
 def _cmd_voices(args: argparse.Namespace, cfg: TTSConfig) -> None:
     """Handle the ``voices`` subcommand."""
-    if not args.refresh:
-        cached = get_cached_voices(ttl_seconds=cfg.cache_ttl_seconds)
-        if cached is not None:
-            voices = cached
-            # Apply client-side filters on cached data
-            if args.lang:
-                voices = [v for v in voices if any(args.lang.lower() in lc.lower() for lc in v["language_codes"])]
-            if args.name:
-                voices = [v for v in voices if args.name.lower() in v["name"].lower()]
-            if args.gender:
-                voices = [v for v in voices if v["ssml_gender"].upper() == args.gender.upper()]
-            _print_voices(voices)
-            return
-    else:
+    if args.refresh:
         clear_cache()
-
-    print("Fetching voices from Google Cloud …")
     try:
-        voices = list_voices(
-            language_code=args.lang,
-            name_contains=args.name,
-            gender=args.gender,
-        )
+        voices = _load_voices(cfg)
     except Exception as exc:
         print(f"✖  Failed to list voices: {exc}", file=sys.stderr)
         raise SystemExit(1) from exc
 
-    # Cache the *unfiltered* set so later runs benefit
-    all_voices = list_voices() if (args.lang or args.name or args.gender) else voices
-    save_voices(all_voices)
-
-    _print_voices(voices)
-
-
-def _print_voices(voices: list[dict]) -> None:
+    _print_voices(_filter_voices(voices, lang=args.lang, name=args.name, gender=args.gender))
+
+
+def _load_voices(cfg: TTSConfig) -> list[Voice]:
+    """Return the full voice list from the local cache, fetching it once if stale."""
+    voices = get_cached_voices(ttl_seconds=cfg.cache_ttl_seconds)
+    if voices is None:
+        print("Fetching voices from Google Cloud …")
+        voices = list_voices()
+        # Cache the *unfiltered* set so a single fetch serves every filter
+        save_voices(voices)
+    return voices
+
+
+def _filter_voices(
+    voices: list[Voice],
+    lang: str | None = None,
+    name: str | None = None,
+    gender: str | None = None,
+) -> list[Voice]:
+    """Apply the ``voices`` filters client-side."""
+    if lang:
+        voices = [v for v in voices if any(lang.lower() in lc.lower() for lc in v.language_codes)]
+    if name:
+        voices = [v for v in voices if name.lower() in v.name.lower()]
+    if gender:
+        voices = [v for v in voices if v.ssml_gender.upper() == gender.upper()]
+    return voices
+
+
+def _print_voices(voices: list[Voice]) -> None:
     if not voices:
         print("No voices matched your filters.")
         return
     print(f"\n{'Voice Name':<40} {'Lang':<10} {'Gender':<10} {'Hz':>6}")
     print("─" * 70)
     for v in voices:
-        langs = ", ".join(v["language_codes"])
-        print(f"{v['name']:<40} {langs:<10} {v['ssml_gender']:<10} {v['natural_sample_rate_hertz']:>6}")
+        langs = ", ".join(v.language_codes)
+        print(f"{v.name:<40} {langs:<10} {v.ssml_gender:<10} {v.natural_sample_rate_hertz:>6}")
     print(f"\nTotal: {len(voices)} voice(s)\n")
 
 
@@ -130,7 +145,14 @@ def _cmd_synth(args: argparse.Namespace, cfg: TTSConfig) -> None:
 
     print(f"Synthesizing ({cfg.encoding}, rate={cfg.speaking_rate}, pitch={cfg.pitch}) …")
     try:
-        out = synthesize(text, cfg, output_path=args.output)
+        if args.stream:
+            out = _stream_to_disk(text, cfg, args.output)
+            size = out.stat().st_size
+        elif (forwarded := request_synthesis(text, cfg, output_path=args.output)) is not None:
+            out, size = forwarded
+        else:
+            result = synthesize(text, cfg, output_path=args.output)
+            out, size = result.path, result.size
     except ValueError as exc:
         print(f"✖  {exc}", file=sys.stderr)
         raise SystemExit(1) from exc
@@ -138,11 +160,21 @@ def _cmd_synth(args: argparse.Namespace, cfg: TTSConfig) -> None:
         print(f"✖  Synthesis failed: {exc}", file=sys.stderr)
         raise SystemExit(1) from exc
 
-    size_kb = out.stat().st_size / 1024
-    print(f"✔  Saved to {out}  ({size_kb:.1f} KB)")
+    print(f"✔  Saved to {out}  ({size / 1024:.1f} KB)")
 
     if not args.no_play:
-        play(out)
+        play(out, wait=args.blocking)
+
+
+def _stream_to_disk(text: str, cfg: TTSConfig, output_path: Path | None) -> Path:
+    """Drive :func:`stream_synthesize`, reporting progress as chunks arrive."""
+    out, chunks = stream_synthesize(text, cfg, output_path=output_path)
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        print(f"\r   … {received / 1024:.1f} KB received", end="", flush=True)
+    print()
+    return out
 
 
 def _resolve_text(args: argparse.Namespace) -> str:
@@ -184,8 +216,7 @@ def _cmd_interactive(cfg: TTSConfig) -> None:
             break
         if text.lower() == "/voices":
             try:
-                voices = list_voices(language_code=cfg.language_code)
-                _print_voices(voices)
+                _print_voices(_filter_voices(_load_voices(cfg), lang=cfg.language_code))
             except Exception as exc:
                 print(f"✖  {exc}", file=sys.stderr)
             continue
@@ -195,10 +226,9 @@ def _cmd_interactive(cfg: TTSConfig) -> None:
             continue
 
         try:
-            out = synthesize(text, cfg)
-            size_kb = out.stat().st_size / 1024
-            print(f"✔  {out}  ({size_kb:.1f} KB)")
-            play(out)
+            result = synthesize(text, cfg)
+            print(f"✔  {result.path}  ({result.size / 1024:.1f} KB)")
+            play(result.path)
         except Exception as exc:
             print(f"✖  {exc}", file=sys.stderr)
 
@@ -220,5 +250,7 @@ def main(argv: Sequence[str] | None = None) -> None:
             _cmd_synth(args, cfg)
         case "interactive":
             _cmd_interactive(cfg)
+        case "daemon":
+            serve()
         case _:
             parser.print_help()
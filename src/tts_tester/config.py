@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -20,6 +21,9 @@ ENCODING_MAP: dict[str, int] = {
     "ALAW": 6,
 }
 
+ENCODING_NAMES: tuple[str, ...] = tuple(ENCODING_MAP)
+ENCODING_INDEX: dict[str, int] = {name: i for i, name in enumerate(ENCODING_NAMES)}
+
 ENCODING_EXTENSIONS: dict[str, str] = {
     "LINEAR16": ".wav",
     "MP3": ".mp3",
@@ -28,6 +32,14 @@ ENCODING_EXTENSIONS: dict[str, str] = {
     "ALAW": ".wav",
 }
 
+ENCODING_MIME_TYPES: dict[str, str] = {
+    "LINEAR16": "audio/wav",
+    "MP3": "audio/mpeg",
+    "OGG_OPUS": "audio/ogg",
+    "MULAW": "audio/wav",
+    "ALAW": "audio/wav",
+}
+
 
 @dataclass
 class TTSConfig:
@@ -58,11 +70,21 @@ class TTSConfig:
         return ENCODING_EXTENSIONS.get(self.encoding.upper(), ".bin")
 
 
+# libyaml's C loader is much faster than the pure-Python one when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
+    # Copy so callers can apply overrides without touching the memo
+    return dict(_load_yaml_cached(str(path), path.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict[str, Any]:
     with open(path, encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+        data = yaml.load(fh, Loader=_YAML_LOADER)
     return data if isinstance(data, dict) else {}
 
 
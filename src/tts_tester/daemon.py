@@ -0,0 +1,199 @@
+"""Local synthesis daemon – keeps one TTS client alive across CLI invocations.
+
+``tts-tester daemon`` listens on a Unix socket; ``tts-tester synth`` forwards
+its request there when the socket exists, skipping the per-process import,
+credential lookup and client setup.  The gRPC channel is reused while it
+stays connected, but an idle channel may drop and reconnect (with a fresh
+TLS handshake) on the next request.  Each connection carries one JSON
+request and one JSON response.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import msgspec
+
+from tts_tester.config import TTSConfig
+from tts_tester.tts import _get_client, synthesize
+
+
+_CONNECT_TIMEOUT = 2.0
+# Long text is split and synthesized in parallel, so this is generous
+_RESPONSE_TIMEOUT = 120.0
+
+# Unix sockets and uid checks are unavailable on Windows; synth runs in-process
+_SUPPORTED = hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+class _Request(msgspec.Struct):
+    text: str
+    config: dict[str, Any]
+    output: str | None = None
+
+
+class _Response(msgspec.Struct):
+    path: str = ""
+    size: int = 0
+    error: str = ""
+    # "value" for invalid input (re-raised as ValueError), "" otherwise
+    error_kind: str = ""
+
+
+def socket_path() -> Path:
+    """Return the daemon socket path.
+
+    ``$XDG_RUNTIME_DIR/tts-tester.sock`` when set, otherwise a per-user
+    ``tts-tester-<uid>/`` directory under the system temp dir, so the
+    socket never sits at a fixed name in shared ``/tmp``.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "tts-tester.sock"
+    return Path(tempfile.gettempdir()) / f"tts-tester-{os.getuid()}" / "tts-tester.sock"
+
+
+def request_synthesis(
+    text: str,
+    cfg: TTSConfig,
+    output_path: Path | None = None,
+) -> tuple[Path, int] | None:
+    """Ask a running daemon to synthesize *text*.
+
+    Returns ``(path, size)`` of the written file, or ``None`` when no
+    daemon is listening so the caller can synthesize in-process.
+    """
+    if not text.strip():
+        raise ValueError("Input text must not be empty.")
+    if not _SUPPORTED:
+        return None
+    path = socket_path()
+    try:
+        owner = path.stat().st_uid
+    except OSError:
+        return None
+    if owner != os.getuid():
+        # Never hand text to (or play files from) someone else's socket
+        print(f"⚠  Ignoring daemon socket {path}: owned by another user.", file=sys.stderr)
+        return None
+
+    request = _Request(
+        text=text,
+        config=asdict(cfg),
+        output=str(output_path.resolve()) if output_path else None,
+    )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            # Stale socket file or daemon not accepting – fall back to in-process
+            return None
+        sock.settimeout(_RESPONSE_TIMEOUT)
+        try:
+            sock.sendall(msgspec.json.encode(request))
+            sock.shutdown(socket.SHUT_WR)
+            raw = _recv_all(sock)
+        except TimeoutError as exc:
+            # Don't silently redo (and re-bill) work a slow daemon may still finish
+            raise RuntimeError(
+                f"The daemon on {path} did not answer within {_RESPONSE_TIMEOUT:.0f} s; "
+                "restart it, or stop it to synthesize in-process."
+            ) from exc
+        except OSError:
+            return None  # daemon went away mid-request
+
+    response = msgspec.json.decode(raw, type=_Response)
+    if response.error:
+        if response.error_kind == "value":
+            raise ValueError(response.error)
+        raise RuntimeError(response.error)
+    return Path(response.path), response.size
+
+
+def serve(path: Path | None = None) -> None:
+    """Accept synthesis requests on *path* until interrupted."""
+    if not _SUPPORTED:
+        raise SystemExit("✖  The daemon needs Unix domain sockets, which this platform lacks.")
+    path = path or socket_path()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir or path.parent != Path(runtime_dir):
+        # $XDG_RUNTIME_DIR is already private to the user; anything else isn't
+        _ensure_private_dir(path.parent)
+    if path.exists():
+        if _is_listening(path):
+            raise SystemExit(f"✖  A daemon is already listening on {path}")
+        try:
+            path.unlink()
+        except OSError as exc:
+            raise SystemExit(f"✖  Cannot remove stale socket {path}: {exc.strerror}") from exc
+
+    _get_client()  # load credentials and build the client up front
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+        server.listen()
+        print(f"✔  Listening on {path}  (Ctrl+C to stop)")
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    _handle(conn)
+        except KeyboardInterrupt:
+            print("\nBye!")
+        finally:
+            path.unlink(missing_ok=True)
+
+
+# ── Internals ────────────────────────────────────────────────────────────────
+
+
+def _handle(conn: socket.socket) -> None:
+    try:
+        request = msgspec.json.decode(_recv_all(conn), type=_Request)
+        cfg = TTSConfig(**request.config)
+        result = synthesize(
+            request.text,
+            cfg,
+            output_path=Path(request.output) if request.output else None,
+        )
+        response = _Response(path=str(result.path), size=result.size)
+    except ValueError as exc:
+        response = _Response(error=str(exc), error_kind="value")
+    except Exception as exc:
+        response = _Response(error=str(exc))
+    try:
+        conn.sendall(msgspec.json.encode(response))
+    except OSError:
+        pass  # client hung up; nothing to report to
+
+
+def _ensure_private_dir(directory: Path) -> None:
+    """Create *directory* (mode 0700) and check nobody else can use it."""
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = directory.stat()
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise SystemExit(f"✖  {directory} must be owned by you with mode 0700.")
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while chunk := sock.recv(65_536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _is_listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
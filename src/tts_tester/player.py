@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import shutil
@@ -10,6 +11,7 @@ import sys
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def _is_wsl() -> bool:
     """Detect if we're running inside Windows Subsystem for Linux."""
     try:
@@ -32,23 +34,26 @@ def _wsl_to_windows_path(filepath: Path) -> str:
         return str(filepath.resolve())
 
 
-def play(filepath: Path) -> None:
+def play(filepath: Path, wait: bool = False) -> None:
     """Try to play *filepath* using the best available method for the OS.
 
+    Playback runs in the background unless *wait* is true; starting a new
+    clip stops the previous one if it is still playing.
+
     Falls back to opening the file with the default handler or printing
     a manual command when no suitable player is found.
     """
     if _is_wsl():
-        _play_wsl(filepath)
+        _play_wsl(filepath, wait)
         return
 
-    system = platform.system()
+    system = _system()
     if system == "Darwin":
-        _try_run(["afplay", str(filepath)], filepath)
+        _try_run(["afplay", str(filepath)], filepath, wait)
     elif system == "Linux":
-        _play_linux(filepath)
+        _play_linux(filepath, wait)
     elif system == "Windows":
-        _play_windows(filepath)
+        _play_windows(filepath, wait)
     else:
         _fallback(filepath)
 
@@ -56,78 +61,118 @@ def play(filepath: Path) -> None:
 # ── Platform helpers ─────────────────────────────────────────────────────────
 
 
-def _play_wsl(filepath: Path) -> None:
+def _play_wsl(filepath: Path, wait: bool) -> None:
     """Play audio from WSL by invoking Windows-side tools."""
     win_path = _wsl_to_windows_path(filepath)
 
     # Try powershell.exe (available in WSL by default)
-    if shutil.which("powershell.exe"):
+    if _which("powershell.exe"):
         ext = filepath.suffix.lower()
         if ext == ".wav":
             ps_cmd = f'(New-Object Media.SoundPlayer "{win_path}").PlaySync()'
-            _try_run(["powershell.exe", "-Command", ps_cmd], filepath)
+            _try_run(["powershell.exe", "-Command", ps_cmd], filepath, wait)
         else:
             # Start with default Windows handler (non-blocking but works)
             _try_run(
                 ["powershell.exe", "-Command", f'Start-Process "{win_path}"'],
                 filepath,
+                wait,
             )
         return
 
     # Fallback: cmd.exe
-    if shutil.which("cmd.exe"):
-        _try_run(["cmd.exe", "/c", "start", "", win_path], filepath)
+    if _which("cmd.exe"):
+        _try_run(["cmd.exe", "/c", "start", "", win_path], filepath, wait)
         return
 
     _fallback(filepath)
 
 
-def _play_linux(filepath: Path) -> None:
-    ext = filepath.suffix.lower()
+def _play_linux(filepath: Path, wait: bool) -> None:
+    player = _pick_linux_player(filepath.suffix.lower())
+    if player is None:
+        _fallback(filepath)
+        return
+    _try_run([*player, str(filepath)], filepath, wait)
+
 
+@functools.lru_cache(maxsize=None)
+def _pick_linux_player(ext: str) -> tuple[str, ...] | None:
+    """Return the player command (without the file) for *ext*, or ``None``."""
     # Prefer aplay for WAV, mpv/ffplay/paplay for others
-    if ext == ".wav" and shutil.which("aplay"):
-        _try_run(["aplay", str(filepath)], filepath)
-        return
+    if ext == ".wav" and _which("aplay"):
+        return ("aplay",)
 
     for player in ("mpv", "ffplay", "paplay", "xdg-open"):
-        if shutil.which(player):
-            args = [player]
+        if _which(player):
             if player == "ffplay":
-                args += ["-nodisp", "-autoexit"]
-            args.append(str(filepath))
-            _try_run(args, filepath)
-            return
-
-    _fallback(filepath)
+                return (player, "-nodisp", "-autoexit")
+            return (player,)
+    return None
 
 
-def _play_windows(filepath: Path) -> None:
+def _play_windows(filepath: Path, wait: bool) -> None:
     ext = filepath.suffix.lower()
     if ext == ".wav":
         ps_cmd = (
             f'(New-Object Media.SoundPlayer "{filepath}").PlaySync()'
         )
-        _try_run(["powershell", "-Command", ps_cmd], filepath)
+        _try_run(["powershell", "-Command", ps_cmd], filepath, wait)
     else:
-        _try_run(["cmd", "/c", "start", "", str(filepath)], filepath)
+        _try_run(["cmd", "/c", "start", "", str(filepath)], filepath, wait)
 
 
 # ── Internals ────────────────────────────────────────────────────────────────
 
 
-def _try_run(cmd: list[str], filepath: Path) -> None:
+_current: subprocess.Popen | None = None
+
+
+def _try_run(cmd: list[str], filepath: Path, wait: bool) -> None:
+    global _current
     exe = cmd[0]
-    if not shutil.which(exe) and exe not in ("cmd", "cmd.exe", "powershell", "powershell.exe"):
+    if not _which(exe) and exe not in ("cmd", "cmd.exe", "powershell", "powershell.exe"):
         _fallback(filepath)
         return
+    _stop_current()
     try:
         print(f"▶  Playing with {exe} …")
-        subprocess.run(cmd, check=True)
+        # Detach all std streams so background players (mpv) can't grab the TTY
+        _current = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
     except FileNotFoundError:
         _fallback(filepath)
-    except subprocess.CalledProcessError as exc:
-        print(f"⚠  Playback exited with code {exc.returncode}.", file=sys.stderr)
+        return
+    if not wait:
+        return
+    try:
+        returncode = _current.wait()
+    except KeyboardInterrupt:
+        _stop_current()
+        raise
+    if returncode != 0:
+        print(f"⚠  Playback exited with code {returncode}.", file=sys.stderr)
+
+
+def _stop_current() -> None:
+    """Terminate the previous playback process if it is still running."""
+    if _current is not None and _current.poll() is None:
+        _current.terminate()
+
+
+@functools.lru_cache(maxsize=1)
+def _system() -> str:
+    return platform.system()
+
+
+@functools.lru_cache(maxsize=None)
+def _which(exe: str) -> str | None:
+    """``shutil.which`` memoised for the life of the process."""
+    return shutil.which(exe)
 
 
 def _fallback(filepath: Path) -> None:
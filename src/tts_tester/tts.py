@@ -2,17 +2,53 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import struct
 import sys
+import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Callable, Iterator, Sequence
 
 from google.cloud import texttospeech as tts
 
-from tts_tester.config import TTSConfig
+from tts_tester.config import ENCODING_EXTENSIONS, TTSConfig
+from tts_tester.voices import Voice
 
 _OUTPUTS_DIR = Path(__file__).resolve().parent.parent.parent / "outputs"
+_AUDIO_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".cache" / "audio"
+# Oldest entries are evicted once the audio cache holds more files than this
+_AUDIO_CACHE_MAX_FILES = 500
+
+# Long plain text is split at sentence boundaries into chunks of at most
+# this many characters, which are synthesized concurrently
+_MAX_CHUNK_CHARS = 800
+_MAX_PARALLEL_REQUESTS = 8
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+# Only the first few words reach the filename, so never scan more than this
+_SLUG_SCAN_CHARS = 200
+
+# Ping during in-flight calls so a dead connection is noticed mid-request
+# (gRPC sends no pings on an idle channel unless permit_without_calls is
+# set; an idle channel simply reconnects on its next call), and lift
+# gRPC's 4 MB default receive limit, as the stock transport does
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+# The streaming API returns headerless PCM; LINEAR16 output is wrapped in WAV
+_STREAMING_ENCODINGS = ("LINEAR16", "OGG_OPUS")
+_STREAMING_SAMPLE_RATE = 24_000
 
 
 # ── Voice listing ────────────────────────────────────────────────────────────
@@ -22,17 +58,16 @@ def list_voices(
     language_code: str | None = None,
     name_contains: str | None = None,
     gender: str | None = None,
-) -> list[dict[str, Any]]:
+) -> list[Voice]:
     """Fetch voices from the API and optionally filter them.
 
-    Returns a list of dicts with keys:
-        name, language_codes, ssml_gender, natural_sample_rate_hertz
+    Returns a list of ``Voice`` records.
     """
     client = _get_client()
     resp = client.list_voices(language_code=language_code or "")
     gender_upper = gender.upper() if gender else None
 
-    results: list[dict[str, Any]] = []
+    results: list[Voice] = []
     for v in resp.voices:
         gender_name = tts.SsmlVoiceGender(v.ssml_gender).name
         if gender_upper and gender_name != gender_upper:
@@ -40,12 +75,12 @@ def list_voices(
         if name_contains and name_contains.lower() not in v.name.lower():
             continue
         results.append(
-            {
-                "name": v.name,
-                "language_codes": list(v.language_codes),
-                "ssml_gender": gender_name,
-                "natural_sample_rate_hertz": v.natural_sample_rate_hertz,
-            }
+            Voice(
+                name=v.name,
+                language_codes=list(v.language_codes),
+                ssml_gender=gender_name,
+                natural_sample_rate_hertz=v.natural_sample_rate_hertz,
+            )
         )
     return results
 
@@ -53,26 +88,95 @@ def list_voices(
 # ── Synthesis ────────────────────────────────────────────────────────────────
 
 
+@dataclass
+class SynthResult:
+    """Outcome of :func:`synthesize`: where the audio went, plus the audio itself."""
+
+    path: Path
+    size: int
+    audio_content: bytes
+
+
 def synthesize(
     text: str,
     cfg: TTSConfig,
     output_path: Path | None = None,
-) -> Path:
+) -> SynthResult:
     """Synthesize *text* (plain or SSML) and write the audio file.
 
-    Returns the ``Path`` of the written file.
+    Identical requests are served from a content-addressed cache under
+    ``.cache/audio/`` instead of calling the API again.
+
+    Returns a ``SynthResult`` with the written path, its size in bytes and
+    the audio itself, so callers need not stat or re-read the file.
     """
     if not text.strip():
         raise ValueError("Input text must not be empty.")
 
-    client = _get_client()
+    cached = _AUDIO_CACHE_DIR / f"{_request_key(text, cfg)}{cfg.file_extension}"
+    audio = _read_cached_audio(cached)
+    if audio is None:
+        audio = _synthesize_remote(text, cfg)
+        _write_cached_audio(cached, audio)
+
+    out = output_path or _default_output_path(text, cfg)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(audio)
+    return SynthResult(path=out, size=len(audio), audio_content=audio)
+
 
+def _synthesize_remote(text: str, cfg: TTSConfig) -> bytes:
+    """Call the API for *text* and return the raw audio bytes.
+
+    Long plain text is split into sentence chunks that are synthesized
+    concurrently and joined.  SSML and OGG_OPUS are always sent as a single
+    request: SSML cannot be split safely, and joined Ogg streams play
+    unreliably.
+    """
     # Auto-detect SSML
     is_ssml = text.strip().startswith("<speak>")
+    splittable = not is_ssml and cfg.encoding.upper() != "OGG_OPUS"
+    chunks = _split_sentences(text) if splittable else []
+    if len(chunks) > 1:
+        parts = _synthesize_parallel(chunks, cfg)
+        return _join_audio(parts, cfg.encoding)
+
+    client = _get_client()
     synth_input = (
         tts.SynthesisInput(ssml=text) if is_ssml else tts.SynthesisInput(text=text)
     )
+    voice_params, audio_config = _request_params(cfg)
+    response = client.synthesize_speech(
+        input=synth_input,
+        voice=voice_params,
+        audio_config=audio_config,
+    )
+    return response.audio_content
+
+
+def _synthesize_parallel(chunks: list[str], cfg: TTSConfig) -> list[bytes]:
+    """Synthesize each chunk concurrently and return the audio in order.
+
+    Runs on the shared (thread-safe) sync client so the warm channel is
+    reused instead of opening a new one per call.
+    """
+    client = _get_client()
+    voice_params, audio_config = _request_params(cfg)
 
+    def _one(chunk: str) -> bytes:
+        response = client.synthesize_speech(
+            input=tts.SynthesisInput(text=chunk),
+            voice=voice_params,
+            audio_config=audio_config,
+        )
+        return response.audio_content
+
+    workers = min(_MAX_PARALLEL_REQUESTS, len(chunks))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts") as pool:
+        return list(pool.map(_one, chunks))
+
+
+def _request_params(cfg: TTSConfig) -> tuple[tts.VoiceSelectionParams, tts.AudioConfig]:
     voice_params = tts.VoiceSelectionParams(
         language_code=cfg.language_code,
         name=cfg.voice_name or None,
@@ -84,44 +188,239 @@ def synthesize(
         pitch=cfg.pitch,
         volume_gain_db=cfg.volume_gain_db,
     )
+    return voice_params, audio_config
 
-    response = client.synthesize_speech(
-        input=synth_input,
-        voice=voice_params,
-        audio_config=audio_config,
-    )
+
+def stream_synthesize(
+    text: str,
+    cfg: TTSConfig,
+    output_path: Path | None = None,
+) -> tuple[Path, Iterator[bytes]]:
+    """Synthesize *text* with the streaming API, writing audio as it arrives.
+
+    Streaming only works with Chirp 3 HD voices, plain text (no SSML) and
+    the LINEAR16 or OGG_OPUS encodings; pitch and volume are ignored.
+
+    Returns the output ``Path`` and an iterator of raw audio chunks.  The
+    file is complete once the iterator is exhausted.
+    """
+    if not text.strip():
+        raise ValueError("Input text must not be empty.")
+    if text.strip().startswith("<speak>"):
+        raise ValueError("Streaming synthesis does not accept SSML.")
+    if cfg.encoding.upper() not in _STREAMING_ENCODINGS:
+        raise ValueError(
+            f"Streaming synthesis does not support '{cfg.encoding}'. "
+            f"Choose from: {', '.join(_STREAMING_ENCODINGS)}"
+        )
 
     out = output_path or _default_output_path(text, cfg)
+    return out, _stream_to_file(text, cfg, out)
+
+
+def _stream_to_file(text: str, cfg: TTSConfig, out: Path) -> Iterator[bytes]:
+    client = _get_client()
+    is_pcm = cfg.encoding.upper() == "LINEAR16"
+
+    streaming_config = tts.StreamingSynthesizeConfig(
+        voice=tts.VoiceSelectionParams(
+            language_code=cfg.language_code,
+            name=cfg.voice_name or None,
+        ),
+        streaming_audio_config=tts.StreamingAudioConfig(
+            audio_encoding=tts.AudioEncoding.PCM if is_pcm else tts.AudioEncoding.OGG_OPUS,
+            sample_rate_hertz=_STREAMING_SAMPLE_RATE,
+            speaking_rate=cfg.speaking_rate,
+        ),
+    )
+    requests = iter(
+        [
+            tts.StreamingSynthesizeRequest(streaming_config=streaming_config),
+            tts.StreamingSynthesizeRequest(input=tts.StreamingSynthesisInput(text=text)),
+        ]
+    )
+
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_bytes(response.audio_content)
-    return out
+    with open(out, "wb") as fh:
+        wav = None
+        if is_pcm:
+            # wave patches the RIFF sizes in place when closed
+            wav = wave.open(fh, "wb")
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(_STREAMING_SAMPLE_RATE)
+        try:
+            for response in client.streaming_synthesize(requests=requests):
+                chunk = response.audio_content
+                if wav is not None:
+                    wav.writeframesraw(chunk)
+                else:
+                    fh.write(chunk)
+                yield chunk
+        finally:
+            if wav is not None:
+                wav.close()
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 _client_instance: tts.TextToSpeechClient | None = None
+_shared_client: Callable[[], tts.TextToSpeechClient] | None = None
 
 
 def _get_client() -> tts.TextToSpeechClient:
-    """Lazy-initialise the TTS client (uses ADC or GOOGLE_APPLICATION_CREDENTIALS)."""
-    global _client_instance
+    """Return the shared TTS client (uses ADC or GOOGLE_APPLICATION_CREDENTIALS).
+
+    Under Streamlit the client lives in ``st.cache_resource`` so every
+    session and rerun shares one gRPC channel; elsewhere a module global
+    is used.  Streamlit is only consulted if the app already imported it,
+    so the CLI never pays for importing it.
+    """
+    global _client_instance, _shared_client
+    st = sys.modules.get("streamlit")
+    if st is not None and st.runtime.exists():
+        if _shared_client is None:
+            _shared_client = st.cache_resource(show_spinner=False)(_create_client)
+        return _shared_client()
     if _client_instance is None:
-        try:
-            _client_instance = tts.TextToSpeechClient()
-        except Exception as exc:
-            print(
-                "\n✖  Could not authenticate with Google Cloud.\n"
-                "   Make sure you have run:\n"
-                "     gcloud auth application-default login\n"
-                "   or set GOOGLE_APPLICATION_CREDENTIALS to a service-account JSON.\n",
-                file=sys.stderr,
-            )
-            raise SystemExit(1) from exc
+        _client_instance = _create_client()
     return _client_instance
 
 
+def _keepalive_client() -> tts.TextToSpeechClient:
+    transport_cls = tts.TextToSpeechClient.get_transport_class("grpc")
+    channel = transport_cls.create_channel(options=_CHANNEL_OPTIONS)
+    return tts.TextToSpeechClient(transport=transport_cls(channel=channel))
+
+
+def _create_client() -> tts.TextToSpeechClient:
+    try:
+        return _keepalive_client()
+    except Exception as exc:
+        print(
+            "\n✖  Could not authenticate with Google Cloud.\n"
+            "   Make sure you have run:\n"
+            "     gcloud auth application-default login\n"
+            "   or set GOOGLE_APPLICATION_CREDENTIALS to a service-account JSON.\n",
+            file=sys.stderr,
+        )
+        raise SystemExit(1) from exc
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Group sentences into chunks of at most ``_MAX_CHUNK_CHARS`` characters."""
+    chunks: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if current and len(current) + 1 + len(sentence) > _MAX_CHUNK_CHARS:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _join_audio(parts: list[bytes], encoding: str) -> bytes:
+    """Concatenate per-chunk audio into a single file of *encoding*.
+
+    MP3 frames can simply be appended; the WAV encodings need their
+    ``data`` payloads merged under one header.  OGG_OPUS never gets here
+    (see :func:`_synthesize_remote`).
+    """
+    if ENCODING_EXTENSIONS.get(encoding.upper()) == ".wav":
+        return _join_wav(parts)
+    return b"".join(parts)
+
+
+def _join_wav(parts: list[bytes]) -> bytes:
+    header = b""
+    payloads: list[bytes] = []
+    for part in parts:
+        offset = 12  # skip "RIFF" <size> "WAVE"
+        while offset + 8 <= len(part):
+            chunk_id = part[offset : offset + 4]
+            (size,) = struct.unpack_from("<I", part, offset + 4)
+            if chunk_id == b"data":
+                header = header or part[:offset]
+                payloads.append(part[offset + 8 : offset + 8 + size])
+                break
+            offset += 8 + size + (size & 1)
+        else:
+            raise ValueError("Malformed WAV audio returned by the API.")
+
+    data = b"".join(payloads)
+    riff_size = len(header) + len(data)  # file length minus "RIFF" <size>
+    return (
+        b"RIFF"
+        + struct.pack("<I", riff_size)
+        + header[8:]
+        + b"data"
+        + struct.pack("<I", len(data))
+        + data
+    )
+
+
+def _read_cached_audio(path: Path) -> bytes | None:
+    """Return the cached audio at *path*, or ``None`` on a miss."""
+    try:
+        audio = path.read_bytes()
+        if audio:
+            os.utime(path)  # mark as recently used for eviction
+    except OSError:
+        return None
+    return audio or None  # an empty file is never a valid result
+
+
+def _write_cached_audio(path: Path, audio: bytes) -> None:
+    """Atomically store *audio* at *path* and keep the cache bounded."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and rename, so readers only see whole files
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(audio)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _prune_audio_cache(path.parent)
+
+
+def _prune_audio_cache(cache_dir: Path) -> None:
+    entries = []
+    for p in cache_dir.iterdir():
+        if p.suffix == ".tmp":
+            continue
+        try:
+            entries.append((p.stat().st_mtime_ns, p))
+        except OSError:
+            continue  # removed by a concurrent prune
+    excess = len(entries) - _AUDIO_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    entries.sort()
+    for _, p in entries[:excess]:
+        p.unlink(missing_ok=True)
+
+
+def _request_key(text: str, cfg: TTSConfig) -> str:
+    """Hash every parameter that affects the synthesized audio."""
+    params = (
+        text,
+        cfg.language_code,
+        cfg.voice_name,
+        cfg.encoding.upper(),
+        float(cfg.speaking_rate),
+        float(cfg.pitch),
+        float(cfg.volume_gain_db),
+    )
+    return hashlib.blake2b(repr(params).encode("utf-8"), digest_size=16).hexdigest()
+
+
 def _slugify(text: str, max_words: int = 5, max_len: int = 40) -> str:
-    words = re.sub(r"[^\w\s-]", "", text).split()[:max_words]
+    words = _SLUG_STRIP.sub("", text[:_SLUG_SCAN_CHARS]).split()[:max_words]
     slug = "_".join(words).lower()
     return slug[:max_len]
 
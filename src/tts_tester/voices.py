@@ -0,0 +1,14 @@
+"""Voice record type shared by the API wrapper, the cache and the UIs."""
+
+from __future__ import annotations
+
+import msgspec
+
+
+class Voice(msgspec.Struct):
+    """One entry of the Google Cloud TTS voice list."""
+
+    name: str
+    language_codes: list[str]
+    ssml_gender: str
+    natural_sample_rate_hertz: int